@@ -0,0 +1,265 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# Bounded, non-destructive history of delivered messages. Deliveries are kept
+# in a fixed-capacity ring buffer and indexed by delivery sequence number and
+# by the sender's own vector clock entry, so that paged range queries can be
+# answered without scanning the whole history.
+
+__Author__ = 'Kayuã Oleques'
+__GitPage__ = 'https://github.com/kayua'
+__version__ = '1.0.0'
+__initial_data__ = '2024/10/20'
+__last_update__ = '2026/10/19'
+__credits__ = ['INF-UFRGS']
+
+# Import necessary modules and handle missing dependencies
+try:
+    import sys
+    import bisect  # For binary searches over the per-sender indexes
+    import heapq  # For merging per-sender results in delivery order
+    import logging  # For logging events and actions
+    import secrets  # For identifying the history instance in cursors
+    import threading  # For guarding the history against concurrent access
+
+except ImportError as error:
+    # Handle missing imports and guide the user through environment setup
+    print(error)
+    print()
+    print("1. (optional) Setup a virtual environment: ")
+    print("  python3 - m venv ~/Python3env/ReliableCommunication ")
+    print("  source ~/Python3env/DroidAugmentor/bin/activate ")
+    print()
+    print("2. Install requirements:")
+    print("  pip3 install --upgrade pip")
+    print("  pip3 install -r requirements.txt ")
+    print()
+    sys.exit(-1)  # Exit if dependencies are not met
+
+
+class MessageHistory:
+    """
+    Stores the most recent delivered messages in a ring buffer of fixed capacity.
+
+    Every delivery receives a monotonically increasing sequence number. Clients
+    page with opaque cursors '<history_id>.<sequence>', where the history ID is
+    random per instance, so a cursor kept across a node restart is rejected
+    instead of being applied to unrelated deliveries. Because sequence numbers are contiguous, a
+    sequence number maps directly to its ring slot. Causal delivery guarantees
+    that, for each sender, both the sequence number and the sender's own clock
+    entry grow with every delivery, so a sorted per-sender index can be searched
+    by either of them with a binary search.
+    """
+
+    def __init__(self, capacity: int, total_processes: int):
+        """
+        Initializes an empty history.
+
+        Args:
+            capacity (int): Maximum number of delivered messages kept in memory.
+            total_processes (int): Total number of processes in the distributed system.
+        """
+        if capacity < 1:
+            raise ValueError("History capacity must be at least 1")
+
+        self.capacity = capacity
+        self.total_processes = total_processes
+        self.history_id = secrets.token_hex(8)  # Distinguishes cursors of different instances
+
+        # Ring buffer of delivered entries, addressed by sequence % capacity
+        self._entries = [None] * capacity
+        self._next_sequence = 1  # Sequence number of the next delivery
+        self._oldest_sequence = 1  # Sequence number of the oldest retained delivery
+
+        # Per-sender indexes: parallel sorted lists of sender clock entries and
+        # sequence numbers. Evicted positions are skipped through a head offset
+        # and compacted lazily to keep eviction O(1) amortized.
+        self._sender_clocks = [[] for _ in range(total_processes)]
+        self._sender_sequences = [[] for _ in range(total_processes)]
+        self._sender_heads = [0] * total_processes
+
+        # Clock entry and sequence number of the latest evicted delivery of each
+        # sender, used to tell whether a clock query lost deliveries to eviction
+        self._sender_evicted_clocks = [0] * total_processes
+        self._sender_evicted_sequences = [0] * total_processes
+
+        self._lock = threading.Lock()
+
+        logging.info(f"MessageHistory initialized with capacity {capacity}")
+
+    @property
+    def last_sequence(self) -> int:
+        """
+        Returns the sequence number of the latest delivery, or 0 if nothing was delivered.
+        """
+        return self._next_sequence - 1
+
+    def record(self, content: str, sender_ip: str, sender_process_id: int, vector_clock: list) -> int:
+        """
+        Appends a delivered message to the history, evicting the oldest one if full.
+
+        Args:
+            content (str): Content of the delivered message.
+            sender_ip (str): IP address of the sender.
+            sender_process_id (int): Process ID of the sender.
+            vector_clock (list): Vector clock carried by the message.
+
+        Returns:
+            int: The sequence number assigned to the delivery.
+        """
+        with self._lock:
+
+            sequence = self._next_sequence
+
+            # Evict the oldest entry when the ring buffer is full
+            if sequence - self._oldest_sequence == self.capacity:
+                self._evict_oldest()
+
+            self._entries[sequence % self.capacity] = {
+                'sequence': sequence,
+                'message': content,
+                'sender_ip': sender_ip,
+                'sender_id': sender_process_id,
+                'vector_clock': list(vector_clock),
+            }
+            self._sender_clocks[sender_process_id].append(vector_clock[sender_process_id])
+            self._sender_sequences[sender_process_id].append(sequence)
+            self._next_sequence += 1
+
+        logging.debug(f"MessageHistory: Recorded delivery {sequence} from process {sender_process_id}")
+        return sequence
+
+    def _evict_oldest(self):
+        """
+        Drops the oldest entry from the ring buffer and from its sender index.
+        Must be called with the lock held.
+        """
+        entry = self._entries[self._oldest_sequence % self.capacity]
+        self._entries[self._oldest_sequence % self.capacity] = None
+        self._oldest_sequence += 1
+
+        sender = entry['sender_id']
+        self._sender_heads[sender] += 1
+        self._sender_evicted_clocks[sender] = entry['vector_clock'][sender]
+        self._sender_evicted_sequences[sender] = entry['sequence']
+
+        # Compact the sender index once most of it has been evicted
+        head = self._sender_heads[sender]
+        if head * 2 > len(self._sender_sequences[sender]):
+            del self._sender_clocks[sender][:head]
+            del self._sender_sequences[sender][:head]
+            self._sender_heads[sender] = 0
+
+    def since(self, cursor: str, limit: int) -> dict:
+        """
+        Returns up to `limit` deliveries with a sequence number greater than `cursor`.
+
+        Args:
+            cursor (str): Cursor returned by the previous page, or '0' to start from the oldest delivery.
+            limit (int): Maximum number of deliveries in the page.
+
+        Returns:
+            dict: A page containing the messages, the cursor for the next page and
+                  whether deliveries after `cursor` were already evicted.
+        """
+        with self._lock:
+
+            cursor = self._parse_cursor(cursor)
+            truncated = cursor + 1 < self._oldest_sequence
+            first = max(cursor + 1, self._oldest_sequence)
+            last = min(first + limit, self._next_sequence)
+            messages = [self._entries[sequence % self.capacity] for sequence in range(first, last)]
+
+            return self._build_page(messages, cursor, truncated)
+
+    def after_clock(self, vector_clock: list, cursor: str, limit: int) -> dict:
+        """
+        Returns up to `limit` deliveries not covered by `vector_clock`, that is,
+        messages from sender j whose clock entry j is greater than vector_clock[j].
+        Only deliveries with a sequence number greater than `cursor` are returned,
+        so pages can be followed with the returned cursor.
+
+        Args:
+            vector_clock (list): Vector clock already known by the client.
+            cursor (str): Cursor returned by the previous page, or '0' to start from the oldest delivery.
+            limit (int): Maximum number of deliveries in the page.
+
+        Returns:
+            dict: A page containing the messages, the cursor for the next page and
+                  whether deliveries after `cursor` and not covered by `vector_clock`
+                  were already evicted.
+        """
+        if len(vector_clock) != self.total_processes:
+            raise ValueError(f"Vector clock must have {self.total_processes} entries")
+
+        with self._lock:
+
+            cursor = self._parse_cursor(cursor)
+
+            # Locate, for each sender, the first indexed delivery past both bounds
+            sender_ranges = []
+            for sender in range(self.total_processes):
+                clocks = self._sender_clocks[sender]
+                sequences = self._sender_sequences[sender]
+                head = self._sender_heads[sender]
+                start = max(bisect.bisect_right(clocks, vector_clock[sender], lo=head),
+                            bisect.bisect_right(sequences, cursor, lo=head))
+                sender_ranges.append(sequences[start:start + limit])
+
+            # Merge the per-sender ranges back into delivery order
+            merged = heapq.merge(*sender_ranges)
+            messages = [self._entries[sequence % self.capacity]
+                        for sequence, _ in zip(merged, range(limit))]
+
+            # Deliveries of a sender are evicted in clock order, so only the latest
+            # evicted one needs to be checked against both bounds
+            truncated = any(self._sender_evicted_clocks[sender] > vector_clock[sender] and
+                            self._sender_evicted_sequences[sender] > cursor
+                            for sender in range(self.total_processes))
+            return self._build_page(messages, cursor, truncated)
+
+    def _parse_cursor(self, cursor: str) -> int:
+        """
+        Extracts the sequence number from a cursor. Rejects cursors issued by another
+        history instance, such as cursors kept by a client across a node restart, and
+        cursors past the latest delivery, so that the client resynchronizes instead
+        of silently skipping deliveries. Must be called with the lock held.
+
+        Args:
+            cursor (str): Cursor returned by a previous page, or '0'.
+
+        Returns:
+            int: Sequence number of the last delivery already seen by the client.
+        """
+        if cursor == '0':
+            return 0
+
+        history_id, _, sequence = cursor.partition('.')
+        if history_id != self.history_id:
+            raise ValueError(f"Cursor {cursor} was not issued by this history, restart from '0'")
+
+        if not sequence.isdigit() or int(sequence) > self.last_sequence:
+            raise ValueError(f"Cursor {cursor} is not a valid position in this history")
+
+        return int(sequence)
+
+    def _build_page(self, messages: list, cursor: int, truncated: bool) -> dict:
+        """
+        Builds the response page for a query. Must be called with the lock held.
+
+        Args:
+            messages (list): Entries included in the page, in delivery order.
+            cursor (int): Sequence number the query started from.
+            truncated (bool): Whether deliveries after the cursor were evicted.
+
+        Returns:
+            dict: The page with copies of the entries and the next cursor.
+        """
+        next_sequence = messages[-1]['sequence'] if messages else max(cursor, self._oldest_sequence - 1)
+        return {
+            'messages': [dict(entry, vector_clock=list(entry['vector_clock'])) for entry in messages],
+            'next_cursor': f"{self.history_id}.{next_sequence}",
+            'history_id': self.history_id,
+            'last_sequence': self.last_sequence,
+            'truncated': truncated,
+        }
@@ -22,6 +22,7 @@ try:
 
     # Import custom modules for vector clocks and virtual sockets
     from Components.VectorClock import VectorClock
+    from Components.MessageHistory import MessageHistory
     from Components.VirtualSocket import VirtualSocket
 
 except ImportError as error:
@@ -47,7 +48,7 @@ class ThreadProcess:
     """
 
     def __init__(self, process_id: int, total_processes: int, listen_port: int, send_port: int,
-                 max_delay: float, address: str):
+                 max_delay: float, address: str, history_capacity: int):
         """
         Initializes the process with unique parameters such as its ID, total
         number of processes, communication ports, and address.
@@ -59,6 +60,7 @@ class ThreadProcess:
             send_port (int): The port used for sending messages.
             max_delay (float): Maximum allowable message transmission delay.
             address (str): The IP address of the current host.
+            history_capacity (int): Maximum number of delivered messages kept in the history.
         """
 
         self.process_id = process_id
@@ -69,6 +71,8 @@ class ThreadProcess:
         # Queues to manage messages: processed and pending
         self.message_queue = queue.Queue()
         self.pending_messages = queue.Queue()
+        # Non-destructive record of delivered messages for history queries
+        self.message_history = MessageHistory(history_capacity, total_processes)
 
         logging.info(f"Process {self.process_id} initialized with vector clock {self.vector_clock.vector}")
 
@@ -136,6 +140,7 @@ class ThreadProcess:
             logging.info(f"Process {self.process_id}: Vector clock updated to: {self.vector_clock.vector}")
             # Add the message to the queue for processing
             self.message_queue.put((content_message, sender_ip))
+            self.message_history.record(content_message, sender_ip, sender_process_id, vector_clock_message)
             self.process_pending_messages()  # Check and process any pending messages
 
         else:
@@ -0,0 +1,176 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+# Tests for the delivered-message history, covering eviction across index
+# compaction, clock and cursor bounds, paging and eviction reporting.
+# Run from the repository root with: python3 -m unittest discover Tests
+
+__Author__ = 'Kayuã Oleques'
+__GitPage__ = 'https://github.com/kayua'
+__version__ = '1.0.0'
+__initial_data__ = '2026/10/19'
+__last_update__ = '2026/10/19'
+__credits__ = ['INF-UFRGS']
+
+import random
+import unittest
+
+from Components.MessageHistory import MessageHistory
+
+
+def deliver(history, receiver_clock, sender):
+    """
+    Records the next causal delivery from `sender`, as ThreadProcess would.
+
+    Args:
+        history (MessageHistory): History receiving the delivery.
+        receiver_clock (list): Vector clock of the receiver, updated in place.
+        sender (int): Process ID of the sender.
+
+    Returns:
+        int: Sequence number of the delivery.
+    """
+    receiver_clock[sender] += 1
+    return history.record(f"message {receiver_clock[sender]} from {sender}", '127.0.0.1',
+                          sender, list(receiver_clock))
+
+
+def follow_pages(query, limit):
+    """
+    Follows `next_cursor` from '0' until a page comes back empty.
+
+    Args:
+        query (callable): Function receiving a cursor and a limit and returning a page.
+        limit (int): Page size.
+
+    Returns:
+        list: Sequence numbers of every delivery returned, in order.
+    """
+    sequences, cursor = [], '0'
+    while True:
+        page = query(cursor, limit)
+        if not page['messages']:
+            return sequences
+        sequences.extend(entry['sequence'] for entry in page['messages'])
+        cursor = page['next_cursor']
+
+
+class TestMessageHistory(unittest.TestCase):
+
+    def test_eviction_across_compaction(self):
+        history = MessageHistory(capacity=3, total_processes=2)
+        clock = [0, 0]
+
+        # Sender 0 delivers enough to compact its index several times
+        for _ in range(10):
+            deliver(history, clock, 0)
+        deliver(history, clock, 1)
+
+        page = history.since('0', 10)
+        self.assertEqual([entry['sequence'] for entry in page['messages']], [9, 10, 11])
+        self.assertTrue(page['truncated'])
+
+        page = history.after_clock([0, 0], '0', 10)
+        self.assertEqual([entry['sequence'] for entry in page['messages']], [9, 10, 11])
+        self.assertEqual([entry['vector_clock'][0] for entry in page['messages']], [9, 10, 10])
+
+    def test_after_clock_with_cursor_and_clock_bounds(self):
+        history = MessageHistory(capacity=10, total_processes=3)
+        clock = [0, 0, 0]
+        for sender in [0, 1, 0, 2, 1, 0, 2]:
+            deliver(history, clock, sender)
+
+        # Clock bound only: sender 0 past entry 1, sender 1 past entry 1, sender 2 past entry 0
+        page = history.after_clock([1, 1, 0], '0', 10)
+        self.assertEqual([entry['sequence'] for entry in page['messages']], [3, 4, 5, 6, 7])
+
+        # Both bounds: only deliveries after sequence 4 that the clock does not cover
+        cursor = f"{history.history_id}.4"
+        page = history.after_clock([1, 1, 0], cursor, 10)
+        self.assertEqual([entry['sequence'] for entry in page['messages']], [5, 6, 7])
+
+        page = history.after_clock([3, 2, 1], cursor, 10)
+        self.assertEqual([entry['sequence'] for entry in page['messages']], [7])
+
+    def test_follow_next_cursor_through_pages(self):
+        history = MessageHistory(capacity=8, total_processes=2)
+        clock = [0, 0]
+        for sender in [0, 1, 1, 0, 1, 0, 0, 1, 1, 0]:
+            deliver(history, clock, sender)
+
+        self.assertEqual(follow_pages(history.since, 3), list(range(3, 11)))
+
+        after_clock = lambda cursor, limit: history.after_clock([3, 0], cursor, limit)
+        self.assertEqual(follow_pages(after_clock, 2), [3, 5, 7, 8, 9, 10])
+
+    def test_truncated_per_sender(self):
+        history = MessageHistory(capacity=2, total_processes=2)
+        clock = [0, 0]
+        for sender in [0, 1, 0, 0]:
+            deliver(history, clock, sender)
+
+        # Evicted: sequence 1 (sender 0, entry 1) and sequence 2 (sender 1, entry 1)
+        self.assertTrue(history.after_clock([0, 1], '0', 10)['truncated'])
+        self.assertTrue(history.after_clock([1, 0], '0', 10)['truncated'])
+        self.assertFalse(history.after_clock([1, 1], '0', 10)['truncated'])
+        self.assertFalse(history.after_clock([3, 1], '0', 10)['truncated'])
+
+        # A cursor past an evicted delivery means the client already saw it
+        self.assertFalse(history.after_clock([1, 0], f"{history.history_id}.2", 10)['truncated'])
+        self.assertTrue(history.after_clock([0, 0], f"{history.history_id}.1", 10)['truncated'])
+
+    def test_rejects_foreign_and_future_cursors(self):
+        history = MessageHistory(capacity=4, total_processes=1)
+        restarted = MessageHistory(capacity=4, total_processes=1)
+        for target in (history, restarted):
+            clock = [0]
+            for _ in range(3):
+                deliver(target, clock, 0)
+
+        cursor = history.since('0', 2)['next_cursor']
+        with self.assertRaises(ValueError):
+            restarted.since(cursor, 2)
+        with self.assertRaises(ValueError):
+            history.since(f"{history.history_id}.4", 2)
+        with self.assertRaises(ValueError):
+            history.after_clock([0, 0], '0', 2)
+
+    def test_matches_brute_force_model(self):
+        generator = random.Random(7)
+
+        for _ in range(100):
+            total_processes = generator.randint(1, 4)
+            capacity = generator.randint(1, 12)
+            history = MessageHistory(capacity, total_processes)
+            clock = [0] * total_processes
+            delivered = []
+
+            for _ in range(generator.randint(0, 40)):
+                sender = generator.randrange(total_processes)
+                deliver(history, clock, sender)
+                delivered.append((sender, list(clock)))
+
+            evicted = delivered[:max(0, len(delivered) - capacity)]
+            retained = list(enumerate(delivered, start=1))[len(evicted):]
+
+            vector_clock = [generator.randint(0, value) for value in clock]
+            cursor = generator.randint(0, len(delivered))
+            cursor_text = f"{history.history_id}.{cursor}" if cursor else '0'
+            limit = generator.randint(1, 6)
+
+            expected = [sequence for sequence, (sender, entry_clock) in retained
+                        if sequence > cursor and entry_clock[sender] > vector_clock[sender]]
+            expected_truncated = any(entry_clock[sender] > vector_clock[sender] and sequence > cursor
+                                     for sequence, (sender, entry_clock) in enumerate(evicted, start=1))
+
+            page = history.after_clock(vector_clock, cursor_text, limit)
+            self.assertEqual([entry['sequence'] for entry in page['messages']], expected[:limit])
+            self.assertEqual(page['truncated'], expected_truncated)
+
+            page = history.since(cursor_text, limit)
+            expected = [sequence for sequence, _ in retained if sequence > cursor]
+            self.assertEqual([entry['sequence'] for entry in page['messages']], expected[:limit])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,358 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+This script starts a fleet of local nodes described by a cluster spec. Nodes
+are forked from a pre-warmed fork-server parent that has already imported
+Flask and the communication components, so imports are shared copy-on-write
+instead of being repeated by every interpreter. Each node signals readiness
+once its sockets are bound, and the launcher reports the time until all nodes
+are ready together with the memory used by each node.
+"""
+
+__Author__ = 'Kayuã Oleques'
+__GitPage__ = 'https://github.com/kayua'
+__version__ = '1.0.0'
+__initial_data__ = '2026/10/19'
+__last_update__ = '2026/10/19'
+__credits__ = ['INF-UFRGS']
+
+# Import necessary modules and handle missing dependencies
+try:
+
+    import sys
+    import json
+    import time
+    import queue
+    import logging
+    import argparse
+    import multiprocessing
+
+    import main
+
+except ImportError as error:
+    # Handle missing imports and guide the user through environment setup
+    print(error)
+    print()
+    print("1. (optional) Setup a virtual environment: ")
+    print("  python3 - m venv ~/Python3env/ReliableCommunication ")
+    print("  source ~/Python3env/DroidAugmentor/bin/activate ")
+    print()
+    print("2. Install requirements:")
+    print("  pip3 install --upgrade pip")
+    print("  pip3 install -r requirements.txt ")
+    print()
+    sys.exit(-1)  # Exit if dependencies are not met
+
+# Default configuration values
+DEFAULT_READY_TIMEOUT = 60.0
+DEFAULT_NODE_VERBOSITY = 'WARNING'
+
+# Settings used for any key missing from both the spec defaults and the node entry
+NODE_DEFAULTS = {
+    'listen_port': main.DEFAULT_LISTEN_PORT,
+    'send_port': main.DEFAULT_SEND_PORT,
+    'max_delay': main.DEFAULT_MAX_DELAY,
+    'max_retries': main.DEFAULT_MAX_RETRIES,
+    'address': main.DEFAULT_IP_ADDRESS,
+    'history_capacity': main.DEFAULT_HISTORY_CAPACITY,
+    'history_page_size': main.DEFAULT_HISTORY_PAGE_SIZE,
+    'headless': False,
+    'flask_port': None,
+}
+
+# Accepted types of every setting a spec may contain
+NODE_SETTING_TYPES = {
+    'process_id': (int,),
+    'number_processes': (int,),
+    'listen_port': (int,),
+    'send_port': (int,),
+    'max_delay': (int, float),
+    'max_retries': (int,),
+    'address': (str,),
+    'history_capacity': (int,),
+    'history_page_size': (int,),
+    'headless': (bool,),
+    'flask_port': (int, type(None)),
+}
+
+
+def load_cluster_spec(spec_path):
+    """
+    Reads a cluster spec and expands it into the settings of every node.
+
+    The spec is a JSON object with an optional 'defaults' object, applied to
+    every node, and a 'nodes' list with the per-node settings, for example:
+
+        {"defaults": {"address": "127.0.0.1", "headless": true},
+         "nodes": [{"listen_port": 6000, "send_port": 6001},
+                   {"listen_port": 6001, "send_port": 6000, "headless": false, "flask_port": 5000}]}
+
+    Nodes without 'process_id' take their position in the list, and
+    'number_processes' defaults to the number of nodes. Process IDs must be
+    unique and lower than 'number_processes'.
+
+    Args:
+        spec_path (str): Path to the JSON cluster spec.
+
+    Returns:
+        list: One argparse.Namespace per node, as expected by main.run_node.
+
+    Raises:
+        OSError: If the spec file cannot be read.
+        ValueError: If the spec is not valid JSON or the settings of a node are invalid.
+    """
+    with open(spec_path) as spec_file:
+        spec = json.load(spec_file)
+
+    if not isinstance(spec, dict) or not isinstance(spec.get('nodes'), list) or not spec['nodes']:
+        raise ValueError("The spec must be an object with a non-empty 'nodes' list")
+
+    if not isinstance(spec.get('defaults', {}), dict):
+        raise ValueError("'defaults' must be an object")
+
+    defaults = dict(NODE_DEFAULTS, number_processes=len(spec['nodes']))
+    defaults.update(spec.get('defaults', {}))
+
+    nodes = []
+    process_ids = set()
+    for position, node in enumerate(spec['nodes']):
+
+        if not isinstance(node, dict):
+            raise ValueError(f"Node entry {position} must be an object")
+
+        settings = dict(defaults, process_id=position)
+        settings.update(node)
+        check_node_settings(settings, position)
+
+        if not settings['headless'] and settings['flask_port'] is None:
+            raise ValueError(f"Node {settings['process_id']}: 'flask_port' is required unless 'headless' is set")
+
+        if settings['history_capacity'] < 1 or settings['history_page_size'] < 1:
+            raise ValueError(f"Node {settings['process_id']}: 'history_capacity' and 'history_page_size'"
+                             f" must be at least 1")
+
+        if not 0 <= settings['process_id'] < settings['number_processes']:
+            raise ValueError(f"Node {settings['process_id']}: 'process_id' must be between 0"
+                             f" and {settings['number_processes'] - 1}")
+
+        if settings['process_id'] in process_ids:
+            raise ValueError(f"Node {settings['process_id']}: 'process_id' is used by more than one node")
+
+        if nodes and settings['number_processes'] != nodes[0].number_processes:
+            raise ValueError(f"Node {settings['process_id']}: 'number_processes' must be the same on every node")
+
+        process_ids.add(settings['process_id'])
+        nodes.append(argparse.Namespace(**settings))
+
+    return nodes
+
+
+def check_node_settings(settings, position):
+    """
+    Checks that a node only uses known settings and that each one has the
+    expected type, so that a typo fails at load time instead of silently
+    falling back to a default port.
+
+    Args:
+        settings (dict): Merged settings of the node.
+        position (int): Position of the node in the spec, used in error messages.
+
+    Raises:
+        ValueError: If a setting is unknown or has the wrong type.
+    """
+    for key, value in settings.items():
+
+        if key not in NODE_SETTING_TYPES:
+            raise ValueError(f"Node entry {position}: unknown setting '{key}'")
+
+        expected_types = NODE_SETTING_TYPES[key]
+        # bool is a subclass of int, so it is only accepted where bool is expected
+        if not isinstance(value, expected_types) or (isinstance(value, bool) and bool not in expected_types):
+            raise ValueError(f"Node entry {position}: setting '{key}' has invalid value {value!r}")
+
+
+def start_node(arguments, verbosity, ready_queue):
+    """
+    Entry point of each forked node. Configures logging to a per-node file and
+    runs the node until it is terminated by the launcher.
+
+    Args:
+        arguments (argparse.Namespace): Settings of the node.
+        verbosity (int): Logging level of the node.
+        ready_queue (multiprocessing.Queue): Queue used for the readiness handshake.
+    """
+    main.configure_logging(verbosity, file_prefix=f"node-{arguments.process_id}_")
+    main.run_node(arguments, ready_queue)
+
+
+def read_memory_usage(pid):
+    """
+    Reads the resident (RSS) and proportional (PSS) memory of a process from
+    /proc. PSS splits pages shared copy-on-write between the processes using
+    them, so it shows how much each node really adds to the fleet.
+
+    Args:
+        pid (int): Operating system process ID.
+
+    Returns:
+        dict: 'rss_kb' and 'pss_kb', set to None when /proc is not available.
+    """
+    usage = {'rss_kb': None, 'pss_kb': None}
+    sources = [(f'/proc/{pid}/status', 'VmRSS:', 'rss_kb'), (f'/proc/{pid}/smaps_rollup', 'Pss:', 'pss_kb')]
+
+    for path, field, key in sources:
+        try:
+            with open(path) as proc_file:
+                for line in proc_file:
+                    if line.startswith(field):
+                        usage[key] = int(line.split()[1])
+                        break
+        except OSError:
+            logging.debug(f"Memory usage not available from {path}")
+
+    return usage
+
+
+def wait_until_ready(processes, ready_queue, start_time, timeout):
+    """
+    Collects readiness messages until every node reported ready, a node exited
+    early or the timeout expired.
+
+    Args:
+        processes (dict): Node processes indexed by process ID.
+        ready_queue (multiprocessing.Queue): Queue used for the readiness handshake.
+        start_time (float): Monotonic time at which the launch started.
+        timeout (float): Maximum time, in seconds, to wait for all nodes.
+
+    Returns:
+        dict: Time to ready, in seconds since the launch started, indexed by process ID.
+    """
+    ready_times = {}
+
+    while len(ready_times) < len(processes):
+
+        remaining = timeout - (time.monotonic() - start_time)
+        if remaining <= 0:
+            raise TimeoutError(f"{len(processes) - len(ready_times)} nodes not ready after {timeout} seconds")
+
+        try:
+            process_id = ready_queue.get(timeout=min(remaining, 0.1))
+            ready_times[process_id] = time.monotonic() - start_time
+            logging.debug(f"Node {process_id} ready after {ready_times[process_id]:.3f} seconds")
+
+        except queue.Empty:
+            # Fail fast when a node exited before completing the handshake
+            for process_id, process in processes.items():
+                if process_id not in ready_times and not process.is_alive():
+                    raise RuntimeError(f"Node {process_id} exited with code {process.exitcode} before ready")
+
+    return ready_times
+
+
+def report(processes, ready_times, total_time, report_path=None):
+    """
+    Logs the time to all-ready and the per-node memory usage, and optionally
+    writes them as JSON so cold-start regressions can be tracked.
+
+    Args:
+        processes (dict): Node processes indexed by process ID.
+        ready_times (dict): Time to ready of each node, indexed by process ID.
+        total_time (float): Time, in seconds, until all nodes were ready.
+        report_path (str): Optional path of the JSON report.
+    """
+    nodes = []
+    for process_id, process in sorted(processes.items()):
+        node = {'process_id': process_id, 'pid': process.pid, 'ready_seconds': round(ready_times[process_id], 4)}
+        node.update(read_memory_usage(process.pid))
+        nodes.append(node)
+
+    logging.info(f"All {len(nodes)} nodes ready in {total_time:.3f} seconds")
+    for node in nodes:
+        logging.info(f"\tNode {node['process_id']} (pid {node['pid']}): ready {node['ready_seconds']:.3f}s,"
+                     f" RSS {node['rss_kb']} kB, PSS {node['pss_kb']} kB")
+
+    if report_path:
+        with open(report_path, 'w') as report_file:
+            json.dump({'total_ready_seconds': round(total_time, 4), 'nodes': nodes}, report_file, indent=2)
+        logging.info(f"Report written to {report_path}")
+
+
+def terminate_all(processes):
+    """
+    Terminates every node process and waits for them to exit.
+
+    Args:
+        processes (dict): Node processes indexed by process ID.
+    """
+    for process in processes.values():
+        if process.is_alive():
+            process.terminate()
+
+    for process in processes.values():
+        process.join()
+
+
+if __name__ == "__main__":
+    """
+    Main entry point of the launcher. Parses the cluster spec, starts every node
+    from the fork server, waits for the readiness handshake and reports startup
+    time and memory usage.
+    """
+    # Argument parser setup
+    parser = argparse.ArgumentParser(description="Local fleet launcher")
+    parser.add_argument('--spec', type=str, required=True, help="Path to the JSON cluster spec")
+    parser.add_argument('--ready_timeout', type=float, default=DEFAULT_READY_TIMEOUT,
+                        help="Maximum seconds to wait for all nodes to be ready")
+    parser.add_argument('--node_verbosity', type=str, default=DEFAULT_NODE_VERBOSITY,
+                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], help="Logging level of the nodes")
+    parser.add_argument('--report', type=str, default=None, help="Path of the JSON startup report")
+    parser.add_argument('--exit_when_ready', action='store_true', help="Stop all nodes after the report")
+    args = parser.parse_args()
+
+    # Configure logging with INFO verbosity
+    main.configure_logging(logging.INFO, file_prefix='launcher_')
+
+    try:
+        node_settings = load_cluster_spec(args.spec)
+
+    except (OSError, ValueError) as error:
+        logging.error(f"Invalid cluster spec: {error}")
+        sys.exit(-1)
+
+    # Fork nodes from a server that has already imported the node modules
+    start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    context = multiprocessing.get_context(start_method)
+    if start_method == 'forkserver':
+        context.set_forkserver_preload(['__main__', 'main'])
+
+    ready_queue = context.Queue()
+    processes = {}
+
+    logging.info(f"Starting {len(node_settings)} nodes using '{start_method}'")
+    launch_start = time.monotonic()
+
+    try:
+        for settings in node_settings:
+            process = context.Process(target=start_node, name=f"node-{settings.process_id}",
+                                      args=(settings, getattr(logging, args.node_verbosity), ready_queue))
+            process.start()
+            processes[settings.process_id] = process
+
+        ready_times = wait_until_ready(processes, ready_queue, launch_start, args.ready_timeout)
+        report(processes, ready_times, time.monotonic() - launch_start, args.report)
+
+        if not args.exit_when_ready:
+            for process in processes.values():
+                process.join()
+
+    except (TimeoutError, RuntimeError, OSError) as error:
+        logging.error(f"Launch failed: {error}")
+        sys.exit(-1)
+
+    except KeyboardInterrupt:
+        logging.info("Interrupted, stopping nodes.")
+
+    finally:
+        # Stop the nodes on every exit path, otherwise multiprocessing waits for them at exit
+        terminate_all(processes)
@@ -31,6 +31,7 @@ try:
     from flask import render_template
 
     from Components.View import View
+    from werkzeug.serving import make_server
     from logging.handlers import RotatingFileHandler
     from Components.ThreadProcess import ThreadProcess, waiting_message
 
@@ -60,6 +61,8 @@ DEFAULT_SEND_PORT = 5050
 DEFAULT_MAX_DELAY = 10.0
 DEFAULT_MAX_RETRIES = 100
 DEFAULT_IP_ADDRESS = '127.0.0.1'
+DEFAULT_HISTORY_CAPACITY = 1024
+DEFAULT_HISTORY_PAGE_SIZE = 50
 
 # Initialize Flask app and a message queue
 app = Flask(__name__)
@@ -103,6 +106,39 @@ def receive_message():
     return jsonify({'message': 'No new messages'}), 204
 
 
+@app.route('/history', methods=['GET'])
+def history():
+    """
+    API route to read delivered messages without consuming them. Accepts
+    'since' (cursor returned by the previous page, '0' to start), 'after_clock'
+    (vector clock already known, e.g. '[1, 0, 2]') and 'limit' (page size).
+    Returns a page of deliveries with the cursor to request the next page.
+    """
+    try:
+        cursor = request.args.get('since', '0')
+        limit = int(request.args.get('limit', args.history_page_size))
+        after_clock = request.args.get('after_clock')
+
+        if limit < 1:
+            raise ValueError("'limit' must be positive")
+
+        limit = min(limit, args.history_page_size)
+
+        if after_clock is None:
+            page = communication_process.message_history.since(cursor, limit)
+
+        else:
+            vector_clock = [int(x.strip()) for x in after_clock.replace('[', '').replace(']', '').split(',')]
+            page = communication_process.message_history.after_clock(vector_clock, cursor, limit)
+
+    except ValueError as error:
+        logging.warning(f"Invalid history request: {error}")
+        return jsonify({'error': str(error)}), 400
+
+    logging.debug(f"History requested: {len(page['messages'])} messages, next cursor {page['next_cursor']}")
+    return jsonify(page)
+
+
 @app.route('/get_id', methods=['GET'])
 def get_pid():
     """
@@ -112,14 +148,16 @@ def get_pid():
     return jsonify({'pid': str(args.process_id)})
 
 
-def show_all_settings(arguments):
+def show_all_settings(arguments, show_command=True):
     """
     Logs all settings and command-line arguments after parsing.
     Displays the command used to run the script along with the
-    corresponding values for each argument.
+    corresponding values for each argument. The command is skipped
+    for nodes started by the launcher, which share its command line.
     """
     # Log the command used to execute the script
-    logging.info("Command:\n\t{0}\n".format(" ".join([x for x in sys.argv])))
+    if show_command:
+        logging.info("Command:\n\t{0}\n".format(" ".join([x for x in sys.argv])))
     logging.info("Settings:")
 
     # Calculate the maximum length of argument names for formatting
@@ -145,10 +183,11 @@ def get_logs_path():
     return logs_dir
 
 
-def configure_logging(verbosity):
+def configure_logging(verbosity, file_prefix=''):
     """
     Configures logging to file and console with a rotating file handler.
-    Adjusts log format based on verbosity level.
+    Adjusts log format based on verbosity level. An optional file prefix
+    keeps log files apart when several nodes start in the same second.
     """
     logger = logging.getLogger()
 
@@ -158,7 +197,7 @@ def configure_logging(verbosity):
         logging_format = '%(asctime)s\t***\t%(levelname)s {%(module)s} [%(funcName)s] %(message)s'
 
     from datetime import datetime
-    LOGGING_FILE_NAME = datetime.now().strftime('%Y-%m-%d_%H-%M-%S') + '.log'
+    LOGGING_FILE_NAME = file_prefix + datetime.now().strftime('%Y-%m-%d_%H-%M-%S') + '.log'
     logging_filename = os.path.join(get_logs_path(), LOGGING_FILE_NAME)
 
     logger.setLevel(verbosity)
@@ -182,6 +221,52 @@ def configure_logging(verbosity):
     logger.addHandler(consoleHandler)
 
 
+def run_node(arguments, ready_queue=None):
+    """
+    Starts the communication process for a node and, unless the node is
+    headless, serves the Flask frontend. Blocks for the lifetime of the node.
+
+    Args:
+        arguments (argparse.Namespace): Node settings, as parsed from the command line.
+        ready_queue (multiprocessing.Queue): Optional queue where the process ID is
+            put once the node sockets are bound, used by the launcher handshake.
+    """
+    global args, communication_process
+    args = arguments
+
+    # Log the command-line settings
+    show_all_settings(args, show_command=ready_queue is None)
+
+    # Start the communication process thread
+    communication_process = ThreadProcess(
+        process_id=args.process_id,
+        total_processes=args.number_processes,
+        listen_port=args.listen_port,
+        send_port=args.send_port,
+        max_delay=args.max_delay,
+        address=args.address,
+        history_capacity=args.history_capacity
+    )
+
+    # Start a thread to handle waiting messages
+    waiting_thread = threading.Thread(target=waiting_message, args=(communication_process,))
+    waiting_thread.start()
+
+    if args.headless:
+        logging.info(f"Process {args.process_id}: Running headless, Flask server disabled")
+        if ready_queue is not None:
+            ready_queue.put(args.process_id)
+        waiting_thread.join()
+        return
+
+    # Bind the Flask server before signalling readiness, then serve requests
+    logging.info(f"Starting Flask server on http://127.0.0.1:{args.flask_port}")
+    server = make_server('127.0.0.1', args.flask_port, app, threaded=True)
+    if ready_queue is not None:
+        ready_queue.put(args.process_id)
+    server.serve_forever()
+
+
 if __name__ == "__main__":
     """
     Main entry point of the program. Parses command-line arguments, configures
@@ -196,33 +281,26 @@ if __name__ == "__main__":
     parser.add_argument('--max_delay', type=float, default=DEFAULT_MAX_DELAY, help="Maximum delay communication")
     parser.add_argument('--max_retries', type=int, default=DEFAULT_MAX_RETRIES, help="Maximum retries message send")
     parser.add_argument('--address', type=str, default=DEFAULT_IP_ADDRESS, help="Local IP Address")
-    parser.add_argument('--flask_port', type=int, required=True, help="Flask port for frontend/backend communication")
+    parser.add_argument('--history_capacity', type=int, default=DEFAULT_HISTORY_CAPACITY,
+                        help="Maximum delivered messages kept in history")
+    parser.add_argument('--history_page_size', type=int, default=DEFAULT_HISTORY_PAGE_SIZE,
+                        help="Maximum messages returned per history page")
+    parser.add_argument('--headless', action='store_true', help="Run without the Flask frontend and banner")
+    parser.add_argument('--flask_port', type=int, help="Flask port for frontend/backend communication")
     args = parser.parse_args()
 
-    # Configure logging with INFO verbosity
-    configure_logging(logging.INFO)
-
-    # Initialize the view and communication process
-    view = View()
-    view.print_view("")
-    logging.info(f"Starting Flask server on http://127.0.0.1:{args.flask_port}")
-    # Log the command-line settings
-    show_all_settings(args)
+    if not args.headless and args.flask_port is None:
+        parser.error("--flask_port is required unless --headless is set")
 
+    if args.history_capacity < 1 or args.history_page_size < 1:
+        parser.error("--history_capacity and --history_page_size must be at least 1")
 
-    # Start the communication process thread
-    communication_process = ThreadProcess(
-        process_id=args.process_id,
-        total_processes=args.number_processes,
-        listen_port=args.listen_port,
-        send_port=args.send_port,
-        max_delay=args.max_delay,
-        address=args.address
-    )
+    # Configure logging with INFO verbosity
+    configure_logging(logging.INFO)
 
-    # Start a thread to handle waiting messages
-    waiting_thread = threading.Thread(target=waiting_message, args=(communication_process,))
-    waiting_thread.start()
+    # Initialize the view
+    if not args.headless:
+        view = View()
+        view.print_view("")
 
-    # Start the Flask app
-    app.run(port=args.flask_port)
+    run_node(args)